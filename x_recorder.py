@@ -1,21 +1,58 @@
 import argparse
 import subprocess
+import errno
+import functools
 import os
-import glob
 import json
 import shutil
 import re
+import struct
 import logging
+import sys
+import tempfile
+import threading
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
-from pydub import AudioSegment
-from pydub.silence import detect_silence
+from yt_dlp import YoutubeDL
+from yt_dlp.utils import DownloadError
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    from mutagen.mp4 import MP4
+except ImportError:
+    MP4 = None
+
+try:
+    import av
+except ImportError:
+    av = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 
 # Configuration
 DEFAULT_DOWNLOAD_DIR = '/mnt/e/AV/Capture/X-Recorder/'
 TEMP_DIR = os.path.expanduser("~/Downloads")
+PROGRESS_LOG_INTERVAL = 2.0  # seconds between yt-dlp progress log lines
+METADATA_CACHE_MAX_AGE = 24 * 60 * 60  # seconds a saved .info.json is reused for
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+COPY_BUFFER_SIZE = 1024 * 1024
+# Larger buffer for --output-copy targets, which are often NFS/SMB shares
+# where per-request latency dominates; costs 4 MiB of memory while copying
+NETWORK_COPY_BUFFER_SIZE = 4 * 1024 * 1024
+MAX_COPY_CHUNK = 2**31 - 1  # largest count copy_file_range/sendfile accept per call
+FICLONE = 0x40049409  # Linux ioctl that reflinks a whole file on Btrfs/XFS
 
 # Logging Setup
 logging.basicConfig(
@@ -33,48 +70,106 @@ class Config:
     METADATA_EXTENSIONS: tuple = ('.json', '.m3u8', '.info.json', '.ytdl')
     DURATION_TOLERANCE_MINUTES: int = 5
 
+def _probe_in_process(file_path):
+    """Read container info with PyAV, shaped like ffprobe's JSON output."""
+    with av.open(file_path, metadata_errors='ignore') as container:
+        format_info = {'tags': dict(container.metadata)}
+        if container.duration is not None:
+            format_info['duration'] = str(container.duration / av.time_base)
+        streams = [
+            {'index': stream.index, 'codec_type': stream.type, 'tags': dict(stream.metadata)}
+            for stream in container.streams
+        ]
+    return {'format': format_info, 'streams': streams}
+
+@functools.lru_cache(maxsize=8)
+def _probe(file_path, mtime_ns, size):
+    """Probe one version of a file, in-process with PyAV if possible, else with ffprobe."""
+    if av is not None:
+        try:
+            return _probe_in_process(file_path)
+        except Exception as e:
+            logging.debug(f"PyAV could not probe {file_path}, falling back to ffprobe: {e}")
+    
+    command = [
+        'ffprobe',
+        '-v', 'quiet',
+        '-print_format', 'json',
+        '-show_format',
+        '-show_streams',
+        file_path
+    ]
+    # Parse the raw bytes; both orjson and json accept them, so no str decode pass
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+    return _loads(result.stdout) or {}
+
+def probe_file(file_path):
+    """Return ffprobe info for a file, reusing the result until the file changes."""
+    st = os.stat(file_path)
+    return _probe(file_path, st.st_mtime_ns, st.st_size)
+
+_MP4_EPOCH_OFFSET = 2082844800  # seconds from 1904-01-01 (MP4 epoch) to 1970-01-01
+
+def _read_mp4_mvhd(file_path):
+    """
+    Read duration and creation time straight from an MP4/M4A movie header box.
+    Returns (duration_seconds, creation_timestamp) or None if no mvhd was found.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            pos = 0
+            end = os.fstat(f.fileno()).st_size
+            in_moov = False
+            while pos + 8 <= end:
+                f.seek(pos)
+                size, box_type = struct.unpack('>I4s', f.read(8))
+                header_size = 8
+                if size == 1:
+                    size = struct.unpack('>Q', f.read(8))[0]
+                    header_size = 16
+                elif size == 0:
+                    size = end - pos
+                if size < header_size:
+                    return None
+                
+                if box_type == b'moov' and not in_moov:
+                    # Descend into moov and only walk its children from here on
+                    in_moov = True
+                    end = pos + size
+                    pos += header_size
+                    continue
+                
+                if box_type == b'mvhd' and in_moov:
+                    version = f.read(4)[0]  # version byte + 3 flag bytes
+                    if version == 1:
+                        creation, _, timescale, duration = struct.unpack('>QQIQ', f.read(28))
+                    else:
+                        creation, _, timescale, duration = struct.unpack('>IIII', f.read(16))
+                    if not timescale:
+                        return None
+                    return duration / timescale, creation - _MP4_EPOCH_OFFSET
+                
+                pos += size
+    except (OSError, struct.error, IndexError) as e:
+        logging.debug(f"Could not parse MP4 header of {file_path}: {e}")
+    return None
+
 def extract_metadata(file_path):
     """Extract metadata from media file using ffprobe."""
     try:
-        command = [
-            'ffprobe',
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_entries', 'format_tags',
-            file_path
-        ]
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        metadata = json.loads(result.stdout)
+        info = probe_file(file_path)
         
-        if not metadata or not metadata.get('format', {}).get('tags'):
-            # If no metadata found, try extracting to a temporary file
-            temp_metadata_file = os.path.join(TEMP_DIR, f"metadata_{os.path.basename(file_path)}.txt")
-            extract_cmd = [
-                'ffmpeg',
-                '-i', file_path,
-                '-f', 'ffmetadata',
-                temp_metadata_file
-            ]
-            subprocess.run(extract_cmd, capture_output=True, text=True, check=True)
-            
-            # Read the metadata file
-            with open(temp_metadata_file, 'r', encoding='utf-8') as f:
-                metadata_text = f.read()
-                
-            # Clean up
-            os.remove(temp_metadata_file)
-            
-            # Convert the metadata text to a dictionary
-            metadata = {'format': {'tags': {}}}
-            for line in metadata_text.splitlines():
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    metadata['format']['tags'][key.strip()] = value.strip()
+        # Raw yt-dlp downloads often carry their tags on the audio stream only,
+        # so fold stream tags into the format tags (format-level values win).
+        # Build new dicts, the probe result is cached and must not be mutated.
+        tags = dict(info.get('format', {}).get('tags', {}))
+        for stream in info.get('streams', []):
+            for key, value in stream.get('tags', {}).items():
+                tags.setdefault(key, value)
         
-        return metadata
+        return {**info, 'format': {**info.get('format', {}), 'tags': tags}}
     except subprocess.CalledProcessError:
-        logging.error("Error: ffprobe/ffmpeg failed to extract metadata")
+        logging.error("Error: ffprobe failed to extract metadata")
     except json.JSONDecodeError:
         logging.error("Error: Failed to parse ffprobe output")
     except Exception as e:
@@ -82,19 +177,14 @@ def extract_metadata(file_path):
     
     return {'format': {'tags': {}}}
 
-def sanitize_filename(title):
-    """Make filename safe for all filesystems."""
-    safe_chars = " -._()[]{}#"
-    filename = ''.join(c for c in title if c.isalnum() or c in safe_chars)
-    filename = filename.strip('. ')
-    filename = ' '.join(filename.split())
-    return filename[:Config.MAX_FILENAME_LENGTH]
-
-def analyze_space_metrics(metadata_path):
-    """Extract and log comprehensive viewer metrics from space metadata."""
+def analyze_space_metrics(metadata_or_path):
+    """Extract and log comprehensive viewer metrics from a space metadata dict or JSON file."""
     try:
-        with open(metadata_path, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
+        if isinstance(metadata_or_path, dict):
+            metadata = metadata_or_path
+        else:
+            with open(metadata_or_path, 'rb') as f:
+                metadata = _loads(f.read())
         
         metrics = {
             'title': metadata.get('title', ''),
@@ -119,220 +209,174 @@ def analyze_space_metrics(metadata_path):
             'retweets': metadata.get('retweet_count', 0)
         }
         
-        logging.info("\nSpace Metrics:")
-        logging.info("=" * 50)
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return metrics
+        
+        lines = ["", "Space Metrics:", "=" * 50]
         
         # Title and Creator Info
         if metrics['title']:
-            logging.info(f"Title: {metrics['title']}")
+            lines.append(f"Title: {metrics['title']}")
         if metrics['creator']:
-            logging.info(f"Creator: {metrics['creator']} (Followers: {metrics['creator_followers']:,})")
+            lines.append(f"Creator: {metrics['creator']} (Followers: {metrics['creator_followers']:,})")
         
         # Time Information
         if metrics['started_at'] and metrics['ended_at']:
-            start_time = datetime.strptime(metrics['started_at'], "%Y-%m-%dT%H:%M:%S.%fZ")
-            end_time = datetime.strptime(metrics['ended_at'], "%Y-%m-%dT%H:%M:%S.%fZ")
+            start_time = _parse_datetime(metrics['started_at'])
+            end_time = _parse_datetime(metrics['ended_at'])
             duration_mins = (end_time - start_time).total_seconds() / 60
-            logging.info(f"\nTiming:")
-            logging.info(f"Started: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            logging.info(f"Ended: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            logging.info(f"Duration: {duration_mins:.1f} minutes")
+            lines.append("\nTiming:")
+            lines.append(f"Started: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(f"Ended: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(f"Duration: {duration_mins:.1f} minutes")
         elif metrics['duration']:
-            logging.info(f"\nDuration: {metrics['duration']/60:.1f} minutes")
+            lines.append(f"\nDuration: {metrics['duration']/60:.1f} minutes")
         
         # Viewer Statistics
-        logging.info("\nViewer Statistics:")
+        lines.append("\nViewer Statistics:")
         if metrics['concurrent_viewers']:
-            logging.info(f"Peak Concurrent Viewers: {metrics['concurrent_viewers']:,}")
+            lines.append(f"Peak Concurrent Viewers: {metrics['concurrent_viewers']:,}")
         if metrics['total_viewers']:
-            logging.info(f"Total Viewers: {metrics['total_viewers']:,}")
+            lines.append(f"Total Viewers: {metrics['total_viewers']:,}")
         if metrics['live_viewers']:
-            logging.info(f"Live Viewers: {metrics['live_viewers']:,}")
+            lines.append(f"Live Viewers: {metrics['live_viewers']:,}")
         if metrics['replay_viewers']:
-            logging.info(f"Replay Viewers: {metrics['replay_viewers']:,}")
+            lines.append(f"Replay Viewers: {metrics['replay_viewers']:,}")
             
         # Engagement Metrics
-        logging.info("\nEngagement:")
+        lines.append("\nEngagement:")
         if metrics['participant_count']:
-            logging.info(f"Total Participants: {metrics['participant_count']:,}")
+            lines.append(f"Total Participants: {metrics['participant_count']:,}")
         if metrics['likes']:
-            logging.info(f"Likes: {metrics['likes']:,}")
+            lines.append(f"Likes: {metrics['likes']:,}")
         if metrics['retweets']:
-            logging.info(f"Retweets: {metrics['retweets']:,}")
+            lines.append(f"Retweets: {metrics['retweets']:,}")
             
         # Additional Information
-        logging.info("\nAdditional Information:")
+        lines.append("\nAdditional Information:")
         if metrics['language']:
-            logging.info(f"Language: {metrics['language']}")
+            lines.append(f"Language: {metrics['language']}")
         if metrics['state']:
-            logging.info(f"State: {metrics['state']}")
+            lines.append(f"State: {metrics['state']}")
         if metrics['recording_status']:
-            logging.info(f"Recording Status: {metrics['recording_status']}")
+            lines.append(f"Recording Status: {metrics['recording_status']}")
         if metrics['available_for_replay']:
-            logging.info("Available for Replay: Yes")
+            lines.append("Available for Replay: Yes")
         if metrics['description']:
-            logging.info(f"\nDescription: {metrics['description']}")
+            lines.append(f"\nDescription: {metrics['description']}")
             
-        logging.info("=" * 50)
+        lines.append("=" * 50)
+        # One log record for the whole report instead of one per line
+        logging.info("\n".join(lines))
         return metrics
     except Exception as e:
         logging.error(f"Error analyzing space metrics: {e}")
         return None
 
+def _parse_datetime(value):
+    """
+    Parse an ISO 8601 or YYYYMMDD timestamp without going through strptime.
+    Raises ValueError for anything else.
+    """
+    if len(value) == 8 and value.isdigit():
+        return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]))
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def _format_day(value):
+    """
+    Turn an ISO 8601 or YYYYMMDD timestamp into YYYY-MM-DD by slicing, without
+    building a datetime to format. Raises ValueError for anything else.
+    """
+    if len(value) == 8 and value.isdigit():
+        year, month, day = value[:4], value[4:6], value[6:8]
+    elif len(value) >= 10 and value[4] == '-' and value[7] == '-':
+        year, month, day = value[:4], value[5:7], value[8:10]
+    else:
+        raise ValueError(f"Unrecognized date: {value}")
+    datetime(int(year), int(month), int(day))  # range check only
+    return f'{year}-{month}-{day}'
+
 def get_file_size_mb(file_path):
     """Get file size in megabytes."""
     return os.path.getsize(file_path) / (1024 * 1024)
 
+_NO_VIDEO_CODECS = frozenset(('none', 'n/a'))
+
+def _is_video_format(fmt):
+    """Check a single yt-dlp format for video indicators, stopping at the first hit."""
+    get = fmt.get
+    vcodec = get('vcodec')
+    if vcodec and vcodec.lower() not in _NO_VIDEO_CODECS:
+        return True
+    if (get('width') or 0) > 0 and (get('height') or 0) > 0:
+        return True
+    if (get('fps') or 0) > 0:
+        return True
+    if get('acodec') == 'none':
+        return True
+    format_note = get('format_note')
+    if format_note and 'video' in format_note.lower():
+        return True
+    format_name = get('format')
+    return bool(format_name) and 'video only' in format_name.lower()
+
 def is_video_space(formats):
     """Improved video space detection."""
-    if not formats:
-        return False
-        
-    video_space = False
-    for fmt in formats:
-        if any([
-            fmt.get('vcodec', 'none').lower() not in ['none', 'n/a'],
-            fmt.get('width', 0) > 0 and fmt.get('height', 0) > 0,
-            fmt.get('fps', 0) > 0,
-            'video' in fmt.get('format_note', '').lower(),
-            fmt.get('acodec', '') == 'none',
-            'video only' in fmt.get('format', '').lower()
-        ]):
-            video_space = True
+    for fmt in formats or ():
+        if _is_video_format(fmt):
             logging.info(f"Detected video indicators in format: {fmt.get('format', '')}")
-            break
+            return True
     
-    if not video_space:
-        logging.info("No video indicators found in formats")
-    return video_space
-
-def get_space_creation_date(file_path, specified_date=None):
-    """Get the creation date from file metadata or specified date."""
-    try:
-        # First try to get date from ffprobe
-        command = [
-            'ffprobe',
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_entries', 'format_tags',
-            file_path
-        ]
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        metadata = json.loads(result.stdout)
-        
-        # Try different date formats
-        creation_date = (
-            metadata.get('format', {}).get('tags', {}).get('creation_time') or
-            metadata.get('format', {}).get('tags', {}).get('date') or
-            metadata.get('streams', [{}])[0].get('tags', {}).get('creation_time')
-        )
-        
-        if creation_date:
-            for fmt in ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%d", "%Y%m%d"]:
-                try:
-                    return datetime.strptime(creation_date, fmt).strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
-            
-        if specified_date:
-            try:
-                return datetime.strptime(specified_date, "%Y-%m-%d").strftime("%Y-%m-%d")
-            except ValueError:
-                logging.error(f"Invalid specified date format: {specified_date}")
-        
-        logging.warning("Using current date as fallback")
-        return datetime.now().strftime("%Y-%m-%d")
-        
-    except Exception as e:
-        logging.error(f"Error getting creation date: {e}")
-        return datetime.now().strftime("%Y-%m-%d")
-
-def verify_download(file_path, expected_duration=None):
-    """Verify downloaded file integrity and duration."""
-    try:
-        command = [
-            'ffprobe',
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_streams',
-            file_path
-        ]
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        info = json.loads(result.stdout)
-        
-        duration = float(info.get('format', {}).get('duration', 0))
-        if duration < 60:
-            logging.warning(f"File duration suspiciously short: {duration/60:.1f} minutes")
-            return False
-            
-        if expected_duration and abs(duration - expected_duration) > 300:  # 5 min tolerance
-            logging.warning(f"Duration mismatch: got {duration/60:.1f}min, expected {expected_duration/60:.1f}min")
-            return False
-            
-        logging.info(f"File duration verified: {duration/60:.1f} minutes")
-        return True
-    except Exception as e:
-        logging.error(f"Error verifying download: {e}")
-        return False
+    logging.info("No video indicators found in formats")
+    return False
 
-def cleanup_temp_files(space_id=None, preserve_metadata=True, had_errors=False):
-    """Clean up temporary files with better error handling."""
-    pattern = f'X-Space-{space_id}*' if space_id else 'X-Space-*'
-    preserved_extensions = ['.json', '.m3u8', '.info.json', '.m4a'] if had_errors else ['.json', '.info.json']
-    
+def _scan_tmp(space_id=None):
+    """List the TEMP_DIR entries of a space (or of all spaces) in one directory read."""
+    needle = space_id if space_id else 'X-Space-'
     try:
-        files = glob.glob(os.path.join(TEMP_DIR, pattern))
-        for file in files:
-            try:
-                if preserve_metadata and any(file.endswith(ext) for ext in preserved_extensions):
-                    logging.debug(f"Preserving file: {file}")
-                    continue
-                
-                os.remove(file)
-                logging.info(f"Removed temporary file: {file}")
-            except Exception as e:
-                logging.warning(f"Failed to remove temporary file {file}: {e}")
-    except Exception as e:
-        logging.error(f"Error during cleanup: {e}")
+        with os.scandir(TEMP_DIR) as entries:
+            return [entry for entry in entries if needle in entry.name]
+    except FileNotFoundError:
+        return []
 
 def cleanup_temp_files(space_id=None, preserve_metadata=True, had_errors=False):
     """Clean up temporary files with better error handling."""
-    pattern = f'X-Space-{space_id}*' if space_id else 'X-Space-*'
-    preserved_extensions = ['.json', '.m3u8', '.info.json', '.m4a'] if had_errors else ['.json', '.info.json']
+    prefix = f'X-Space-{space_id}' if space_id else 'X-Space-'
+    preserved_extensions = ('.json', '.m3u8', '.info.json', '.m4a') if had_errors else ('.json', '.info.json')
     try:
-        files = glob.glob(os.path.join(TEMP_DIR, pattern))
+        files = [entry.path for entry in _scan_tmp(space_id) if entry.name.startswith(prefix)]
+        removed = []
+        preserved = 0
         for file in files:
+            if preserve_metadata and file.endswith(preserved_extensions):
+                preserved += 1
+                continue
             try:
-                if preserve_metadata and any(file.endswith(ext) for ext in preserved_extensions):
-                    logging.debug(f"Preserving file: {file}")
-                    continue
                 os.remove(file)
-                logging.info(f"Removed temporary file: {file}")
+                removed.append(file)
             except Exception as e:
                 logging.warning(f"Failed to remove temporary file {file}: {e}")
+        # One summary line instead of a log record per file
+        if removed:
+            logging.info(f"Removed {len(removed)} temporary file(s): {', '.join(removed)}")
+        if preserved:
+            logging.debug(f"Preserved {preserved} temporary file(s) in {TEMP_DIR}")
     except Exception as e:
         logging.error(f"Error during cleanup: {e}")
 
-@dataclass
-class Config:
-    """Configuration settings for X-Recorder."""
-    DEFAULT_DOWNLOAD_DIR: str = '/mnt/e/AV/Capture/X-Recorder/'
-    TEMP_DIR: str = os.path.expanduser("~/Downloads")
-    VALID_AUDIO_EXTENSIONS: tuple = ('.m4a', '.mp3')
-    MAX_FILENAME_LENGTH: int = 255
-    METADATA_EXTENSIONS: tuple = ('.json', '.m3u8', '.info.json', '.ytdl')
+# Anything that is not alphanumeric (\w also covers '_') or in " -._()[]{}#"
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-.()\[\]{}#]')
+_MULTIPLE_SPACES = re.compile(r' {2,}')
 
+@functools.lru_cache(maxsize=1024)
 def sanitize_filename(title):
     """Make filename safe for all filesystems."""
     # Replace problematic characters
-    safe_chars = " -._()[]{}#"
-    filename = ''.join(c for c in title if c.isalnum() or c in safe_chars)
+    filename = _UNSAFE_FILENAME_CHARS.sub('', title)
     # Remove leading/trailing spaces and dots
     filename = filename.strip('. ')
     # Collapse multiple spaces
-    filename = ' '.join(filename.split())
+    filename = _MULTIPLE_SPACES.sub(' ', filename)
     # Limit length
     if len(filename) > 200:
         filename = filename[:200]
@@ -342,17 +386,20 @@ def cleanup_destination_duplicates(space_folder, space_id):
     """Clean up duplicate files in destination folder, keeping the most informative one."""
     try:
         # Get all m4a files for this space
-        files = glob.glob(os.path.join(space_folder, f'*-X-Space-#{space_id}*.m4a'))
+        marker = f'-X-Space-#{space_id}'
+        with os.scandir(space_folder) as entries:
+            files = [entry for entry in entries
+                     if entry.name.endswith('.m4a') and marker in entry.name and entry.is_file()]
         if len(files) <= 1:
             return
 
         # Sort files by name length (longer names typically have more info)
-        # and then by modification time (newer first)
-        files.sort(key=lambda x: (-len(os.path.basename(x)), -os.path.getmtime(x)))
+        # and then by modification time (newer first); DirEntry caches its stat
+        files.sort(key=lambda entry: (-len(entry.name), -entry.stat().st_mtime))
 
         # Keep the first file (most informative/newest) and remove others
-        keep_file = files[0]
-        for file in files[1:]:
+        keep_file = files[0].path
+        for file in (entry.path for entry in files[1:]):
             try:
                 os.remove(file)
                 logging.info(f"Removed duplicate file: {file}")
@@ -364,6 +411,129 @@ def cleanup_destination_duplicates(space_folder, space_id):
     except Exception as e:
         logging.error(f"Error cleaning up destination duplicates: {e}")
 
+# copy_file_range/sendfile errors that mean "not supported here", not a real failure
+_IN_KERNEL_COPY_UNSUPPORTED = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP)
+
+def _fast_copy(src, dst, buffer_size=COPY_BUFFER_SIZE):
+    """Copy a file in the kernel where possible (reflink, copy_file_range, then sendfile)."""
+    binary = getattr(os, 'O_BINARY', 0)
+    src_fd = os.open(src, os.O_RDONLY | binary)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary, 0o644)
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            copied = 0
+            done = False
+            if fcntl is not None and sys.platform.startswith('linux'):
+                try:
+                    # Share the extents instead of copying them (copy-on-write)
+                    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                    done = True
+                except OSError as e:
+                    if e.errno not in _IN_KERNEL_COPY_UNSUPPORTED + (errno.ENOTTY, errno.EBADF):
+                        raise
+            if not done and hasattr(os, 'copy_file_range'):
+                try:
+                    while True:
+                        sent = os.copy_file_range(src_fd, dst_fd, MAX_COPY_CHUNK)
+                        if sent == 0:
+                            break
+                        copied += sent
+                    done = True
+                except OSError as e:
+                    if e.errno not in _IN_KERNEL_COPY_UNSUPPORTED:
+                        raise
+            if not done and hasattr(os, 'sendfile'):
+                try:
+                    while True:
+                        sent = os.sendfile(dst_fd, src_fd, copied, MAX_COPY_CHUNK)
+                        if sent == 0:
+                            break
+                        copied += sent
+                    done = True
+                except OSError as e:
+                    if e.errno not in _IN_KERNEL_COPY_UNSUPPORTED:
+                        raise
+            if not done:
+                logging.debug(f"In-kernel copy unavailable, using buffered copy for {src}")
+                _buffered_copy(src_fd, dst_fd, copied, buffer_size)
+            if hasattr(os, 'posix_fadvise'):
+                # Nothing reads the copy back, don't let it push useful pages out of the cache.
+                # The source is left alone since later steps still read it.
+                os.posix_fadvise(dst_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    shutil.copystat(src, dst)
+
+def _buffered_copy(src_fd, dst_fd, offset=0, buffer_size=COPY_BUFFER_SIZE):
+    """Copy from src_fd to dst_fd starting at offset through one reused buffer."""
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    buf = bytearray(buffer_size)
+    view = memoryview(buf)
+    with open(src_fd, 'rb', buffering=0, closefd=False) as reader:
+        while True:
+            n = reader.readinto(buf)
+            if not n:
+                break
+            written = 0
+            while written < n:
+                written += os.write(dst_fd, view[written:n])
+
+def _copy_files(copies):
+    """Copy each (src, dst) pair in turn."""
+    for src, dst in copies:
+        _fast_copy(src, dst)
+        logging.debug(f"Copied file to: {dst}")
+
+def _publish(src, dst, buffer_size=COPY_BUFFER_SIZE):
+    """Hard-link src to dst when they share a filesystem, otherwise copy the bytes."""
+    try:
+        os.link(src, dst)
+        logging.debug(f"Hard-linked {src} to {dst}")
+        return
+    except OSError as e:
+        # EXDEV (different volume), EEXIST, EPERM on filesystems without links...
+        try:
+            if os.path.samefile(src, dst):
+                # Already linked by an earlier run; copying would truncate the source
+                return
+        except FileNotFoundError:
+            pass
+        logging.debug(f"Hard link not possible ({e}), copying instead")
+    _copy_atomically(src, dst, buffer_size)
+
+def _copy_atomically(src, dst, buffer_size=COPY_BUFFER_SIZE):
+    """
+    Copy under a reserved temporary name next to dst and rename it into place,
+    so a partially copied file never shows up under the final name.
+    """
+    fd, tmp = tempfile.mkstemp(prefix='.', suffix='.part', dir=os.path.dirname(dst) or '.')
+    os.close(fd)
+    try:
+        _fast_copy(src, tmp, buffer_size)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def _unshare(file_path):
+    """
+    Give a hard-linked file its own inode, so editing it in place does not also
+    change the recording an earlier run published from it.
+    """
+    if os.stat(file_path).st_nlink < 2:
+        return
+    logging.debug(f"Breaking hard link of {file_path} before modifying it")
+    _copy_atomically(file_path, file_path)
+
 def copy_to_additional_location(source_file, output_copy_dir, space_id):
     """Copy the file to an additional location."""
     try:
@@ -376,7 +546,7 @@ def copy_to_additional_location(source_file, output_copy_dir, space_id):
         copy_path = os.path.join(copy_space_folder, filename)
 
         # Copy the file
-        shutil.copy2(source_file, copy_path)
+        _publish(source_file, copy_path, buffer_size=NETWORK_COPY_BUFFER_SIZE)
         logging.info(f"Successfully copied file to additional location: {copy_path}")
         return True
     except Exception as e:
@@ -404,83 +574,170 @@ def parse_arguments():
                         help="Enable debug mode for verbose output")
     parser.add_argument("-s", "--space", type=str, 
                         help="Direct link to a specific X Space")
+    parser.add_argument("-r", "--refresh", action="store_true",
+                        help="Fetch space metadata again instead of reusing the saved copy")
     return parser.parse_args()
 
 def check_tmp_for_existing_files(space_id):
     """Check for existing files and return the media file if found."""
-    files = glob.glob(f'{TEMP_DIR}/*{space_id}*.*')
-    if files:
-        # First, look for complete media files
-        media_files = [f for f in files if f.endswith('.m4a') and not f.endswith('.part') and not f.endswith('.info.json')]
-        metadata_files = [f for f in files if f.endswith(('.json', '.m3u8'))]
-        partial_files = [f for f in files if f.endswith('.part')]
-
-        # Log what we found
-        if media_files:
-            selected_file = media_files[0]
-            logging.info(f"Found existing media file: {selected_file}")
-            return selected_file
-
-        if metadata_files:
-            logging.debug("Found metadata files but no complete media file:")
-            for f in metadata_files:
-                logging.debug(f" {f}")
-
-        # Clean up partial downloads
-        for partial_file in partial_files:
-            try:
-                os.remove(partial_file)
-                logging.debug(f"Removed incomplete download: {partial_file}")
-            except Exception as e:
-                logging.warning(f"Failed to remove incomplete download {partial_file}: {e}")
+    media_files = []
+    metadata_files = []
+    partial_files = []
+    # Classify everything in a single pass over the directory listing
+    for entry in _scan_tmp(space_id):
+        name = entry.name
+        if name.endswith('.m4a'):
+            media_files.append(entry.path)
+        elif name.endswith(('.json', '.m3u8')):
+            metadata_files.append(entry.path)
+        elif name.endswith('.part'):
+            partial_files.append(entry.path)
+
+    # Log what we found
+    if media_files:
+        selected_file = media_files[0]
+        logging.info(f"Found existing media file: {selected_file}")
+        return selected_file
+
+    if metadata_files:
+        logging.debug("Found metadata files but no complete media file:")
+        for f in metadata_files:
+            logging.debug(f" {f}")
+
+    # Clean up partial downloads
+    for partial_file in partial_files:
+        try:
+            os.remove(partial_file)
+            logging.debug(f"Removed incomplete download: {partial_file}")
+        except Exception as e:
+            logging.warning(f"Failed to remove incomplete download {partial_file}: {e}")
 
     return None
 
-def download_space(space_url, cookie_path, debug):
+def create_youtube_dl(cookie_path, output_path, debug=False):
+    """Create the in-process yt-dlp instance shared by the metadata probe and the download."""
+    last_progress_log = 0.0
+
+    def log_progress(status):
+        # yt-dlp calls this for every fragment, only log every few seconds
+        nonlocal last_progress_log
+        if status.get('status') != 'downloading':
+            return
+        now = time.monotonic()
+        if now - last_progress_log < PROGRESS_LOG_INTERVAL:
+            return
+        last_progress_log = now
+        downloaded = status.get('downloaded_bytes') or 0
+        total = status.get('total_bytes') or status.get('total_bytes_estimate')
+        if total:
+            logging.info(f"[download] {downloaded / (1024 * 1024):.1f} of {total / (1024 * 1024):.1f} MB "
+                         f"({downloaded / total:.1%})")
+        else:
+            logging.info(f"[download] {downloaded / (1024 * 1024):.1f} MB")
+
+    return YoutubeDL({
+        'cookiefile': cookie_path,
+        'outtmpl': output_path,
+        'writeinfojson': True,
+        'continuedl': True,                # Enable download resumption
+        'nopart': True,                    # Don't use .part files
+        'fragment_retries': float('inf'),  # Keep retrying failed fragments
+        'retries': float('inf'),           # Keep retrying on errors
+        'extractor_args': {'twitter': {'max_retries': ['3']}},  # Twitter-specific retries
+        'logger': logging.getLogger('yt-dlp'),  # Route yt-dlp messages through logging
+        'noprogress': True,
+        'progress_hooks': [log_progress],
+        'verbose': debug
+    })
+
+def fetch_space_metadata(ydl, space_url):
+    """Fetch space metadata in-process without downloading the media."""
+    return ydl.extract_info(space_url, download=False)
+
+def load_cached_space_metadata(metadata_path, max_age=METADATA_CACHE_MAX_AGE):
+    """Return the .info.json saved by a previous run if it is recent enough, else None."""
+    try:
+        st = os.stat(metadata_path)
+        if time.time() - st.st_mtime > max_age:
+            return None
+        with open(metadata_path, 'rb') as f:
+            space_info = _loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.debug(f"Ignoring unreadable cached metadata {metadata_path}: {e}")
+        return None
+    return space_info if isinstance(space_info, dict) and space_info.get('formats') else None
+
+def parse_space_info(space_info, debug=False):
+    """Log metrics for a space and return (title, date, expected_duration, is_video)."""
+    space_title = str(space_info.get('title', ''))
+    space_date = space_info.get('upload_date', '')
+    expected_duration = float(space_info.get('duration') or 0)
+    
+    # Analyze metrics first, straight from memory
+    analyze_space_metrics(space_info)
+    
+    # Then detect video space
+    formats = space_info.get('formats', [])
+    video_space = is_video_space(formats)
+    
+    if debug:
+        logging.debug(f"Space metadata: title='{space_title}', date='{space_date}', "
+                    f"is_video={video_space}, duration={expected_duration/60:.1f}min")
+        if formats:
+            logging.debug("Available formats:")
+            for fmt in formats:
+                logging.debug(f"Format: {fmt}")
+    
+    if expected_duration > 0:
+        logging.info(f"Expected space duration: {expected_duration/60:.1f} minutes")
+    
+    return space_title, space_date, expected_duration, video_space
+
+def download_space(ydl, space_url, space_info=None, refetch_on_error=False):
     """Download X Space with improved error handling and verification."""
     space_id = space_url.split('/')[-1]
     existing_file = check_tmp_for_existing_files(space_id)
 
-    if existing_file and os.path.exists(existing_file) and not existing_file.endswith('.part'):
+    # check_tmp_for_existing_files only returns .m4a entries it just listed, no need to stat again
+    if existing_file:
         logging.info(f"Found previously downloaded file at {existing_file}, using it for processing.")
         return existing_file, False
 
     logging.info(f"Initiating download...")
-    temp_file_path = f'{TEMP_DIR}/X-Space-{space_id}_temp.m4a'
 
     try:
-        # Download command with essential options
-        download_command = [
-            'yt-dlp',
-            '--cookies', cookie_path,
-            '--write-info-json',
-            '--continue',              # Enable download resumption
-            '--no-part',               # Don't use .part files
-            '--fragment-retries', 'infinite',  # Keep retrying failed fragments
-            '--retries', 'infinite',          # Keep retrying on errors
-            '--extractor-args', 'twitter:max_retries=3',  # Twitter-specific retries
-            '-o', temp_file_path,
-            space_url
-        ]
-        
-        if debug:
-            logging.debug(f"Running download command: {' '.join(download_command)}")
+        if space_info:
+            # Reuse the metadata that was already extracted instead of hitting the API again
+            try:
+                info = ydl.process_ie_result(space_info, download=True)
+            except DownloadError as e:
+                if not refetch_on_error:
+                    raise
+                # Media URLs in cached metadata can expire, retry with fresh metadata
+                logging.warning(f"Download from cached metadata failed, refetching: {e}")
+                info = ydl.extract_info(space_url, download=True)
+        else:
+            info = ydl.extract_info(space_url, download=True)
         
-        subprocess.run(download_command, check=True)
+        # yt-dlp reports the final path itself, no need to look for it
+        requested_downloads = info.get('requested_downloads') or [{}]
+        downloaded_path = requested_downloads[-1].get('filepath') or info.get('filepath')
         
-        if os.path.exists(temp_file_path):
+        if downloaded_path:
             # Verify the download
-            if verify_download(temp_file_path):
-                logging.info(f"Successfully downloaded and verified space to {temp_file_path}")
-                return temp_file_path, True
+            if verify_download(downloaded_path):
+                logging.info(f"Successfully downloaded and verified space to {downloaded_path}")
+                return downloaded_path, True
             else:
                 logging.error("Download verification failed")
                 return None, False
         
-        logging.error("Download completed but file not found at expected location")
+        logging.error("Download completed but yt-dlp did not report the output file")
         return None, False
             
-    except subprocess.CalledProcessError as e:
+    except DownloadError as e:
         logging.error(f'Error downloading space with yt-dlp: {e}')
         raise
     except KeyboardInterrupt:
@@ -494,23 +751,20 @@ def download_space(space_url, cookie_path, debug):
 def verify_download(file_path, expected_duration=None):
     """Verify downloaded file integrity and duration."""
     try:
-        command = [
-            'ffprobe',
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_streams',
-            file_path
-        ]
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        info = json.loads(result.stdout)
+        # Read the M4A header directly and only spawn ffprobe if that fails.
+        # Fragmented MP4s always store 0 in mvhd, so only trust a positive duration.
+        mvhd = _read_mp4_mvhd(file_path)
+        if mvhd and mvhd[0] > 0:
+            duration = mvhd[0]
+        else:
+            info = probe_file(file_path)
+            duration = float(info.get('format', {}).get('duration', 0))
         
-        duration = float(info.get('format', {}).get('duration', 0))
         if duration < 60:
             logging.warning(f"File duration suspiciously short: {duration} seconds")
             return False
             
-        if expected_duration and abs(duration - expected_duration) > 300:
+        if expected_duration and abs(duration - expected_duration) > Config.DURATION_TOLERANCE_MINUTES * 60:
             logging.warning(f"Duration mismatch: got {duration/60:.1f}min, expected {expected_duration/60:.1f}min")
             return False
             
@@ -520,26 +774,29 @@ def verify_download(file_path, expected_duration=None):
         logging.error(f"Error verifying download: {e}")
         return False
 
+def _metadata_args(title=None, date=None):
+    """ffmpeg -metadata arguments for the tags that are set."""
+    return [
+        *(['-metadata', f'title={title}'] if title else []),
+        *(['-metadata', f'date={date}'] if date else []),
+    ]
+
 def convert_to_mp3(input_path, output_path, title=None, date=None):
     """Convert to MP3 and add metadata."""
     try:
         command = [
             'ffmpeg',
+            '-v', 'error',  # Only errors on stderr, no banner or progress stats
             '-i', input_path,
+            '-vn',  # Don't decode the video track of video spaces, MP3 only keeps the audio
             '-c:a', 'libmp3lame',
             '-b:a', '192k',  # 192k bitrate for good quality and smaller file size
-            '-map_metadata', '0'
+            '-map_metadata', '0',
+            *_metadata_args(title, date),
+            output_path
         ]
         
-        # Add metadata if provided
-        if title:
-            command.extend(['-metadata', f'title={title}'])
-        if date:
-            command.extend(['-metadata', f'date={date}'])
-            
-        command.append(output_path)
-        
-        subprocess.run(command, check=True, capture_output=True, text=True)
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         logging.info(f"Successfully converted to MP3: {output_path}")
         return True
     except subprocess.CalledProcessError as e:
@@ -551,45 +808,115 @@ def convert_to_mp3(input_path, output_path, title=None, date=None):
         logging.error(f"Unexpected error during MP3 conversion: {e}")
         return False
 
-def detect_long_silence(audio_path, min_silence_len=300000, silence_thresh=-50, max_duration=7200000):
+class _ProcessGroup:
+    """Subprocesses started by worker threads, so the main thread can kill them on failure."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._processes = []
+        self._killed = False
+
+    def add(self, process):
+        with self._lock:
+            if not self._killed:
+                self._processes.append(process)
+                return
+        process.kill()
+
+    def kill(self):
+        with self._lock:
+            self._killed = True
+            processes, self._processes = self._processes, []
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+
+_SILENCE_START_RE = re.compile(r'silence_start:\s*(-?[\d.]+)')
+
+def detect_long_silence(audio_path, min_silence_len=300000, silence_thresh=-50, max_duration=7200000,
+                        processes=None):
     """
     Detect silence longer than 5 minutes (300000 ms) in the audio file.
     Returns the start time of the long silence in milliseconds.
     Max duration is set to 2 hours (7200000 ms) by default.
+    The ffmpeg process is added to processes (a _ProcessGroup), if given, so it can be killed early.
     """
-    audio = AudioSegment.from_file(audio_path)
-    total_duration = len(audio)
-    
-    # If the audio is longer than max_duration, start checking from max_duration
-    start_check = min(total_duration, max_duration)
-    
-    silence_ranges = detect_silence(audio[start_check:], min_silence_len=min_silence_len, silence_thresh=silence_thresh)
+    # ffmpeg's silencedetect scans the audio natively while streaming, instead of
+    # decoding the whole file into memory. Seeking before -i jumps straight to
+    # max_duration, and the reported times are relative to that point.
+    command = [
+        'ffmpeg',
+        '-hide_banner',
+        '-nostats',
+        '-ss', f'{max_duration / 1000:.3f}',
+        '-i', audio_path,
+        '-vn',  # Only the audio matters, don't decode the video track of video spaces
+        '-af', f'silencedetect=noise={silence_thresh}dB:d={min_silence_len / 1000:.3f}',
+        '-f', 'null',
+        '-'
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               text=True, errors='replace')
+    if processes is not None:
+        processes.add(process)
+    try:
+        for line in process.stderr:
+            match = _SILENCE_START_RE.search(line)
+            if match:
+                # Return the start of the first long silence
+                return max_duration + max(0, round(float(match.group(1)) * 1000))
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.wait()
     
-    if silence_ranges:
-        return start_check + silence_ranges[0][0]  # Return the start of the first long silence
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
     return None
 
 def trim_audio(input_path, output_path, trim_point):
     """
     Trim the audio file from the beginning to the trim point.
     """
-    audio = AudioSegment.from_file(input_path)
-    trimmed_audio = audio[:trim_point]
-    trimmed_audio.export(output_path, format="m4a")
+    # Stream copy: a container-level cut with no AAC decode/re-encode
+    command = [
+        'ffmpeg',
+        '-y',
+        '-v', 'error',
+        '-t', f'{trim_point / 1000:.3f}',
+        '-i', input_path,
+        '-c', 'copy',
+        '-movflags', '+faststart',
+        output_path
+    ]
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
     logging.info(f"Audio trimmed at {trim_point/1000:.2f} seconds ({trim_point/60000:.2f} minutes)")
 
 def get_unique_output_path(base_path, base_name, ext):
     """Get a unique output path, checking for both exact matches and similar filenames."""
+    # One directory listing instead of a stat per candidate name
+    with os.scandir(base_path) as entries:
+        existing = {entry.name for entry in entries}
+    
+    filename = f'{base_name}{ext}'
     counter = 1
-    output_path = f'{base_path}/{base_name}{ext}'
-    while os.path.exists(output_path):
-        output_path = f'{base_path}/{base_name}_{counter}{ext}'
+    # Candidates are checked against the listing; only the winner is confirmed
+    # on disk in case something created it after the directory was read
+    while filename in existing or os.path.exists(f'{base_path}/{filename}'):
+        existing.add(filename)
+        filename = f'{base_name}_{counter}{ext}'
         counter += 1
-    return output_path
+    return f'{base_path}/{filename}'
 
 def get_space_creation_date(file_path, specified_date=None):
     """Get the creation date from file metadata or specified date."""
     try:
+        # The mvhd creation time is what ffprobe reports as creation_time;
+        # muxers that don't set it leave it at the 1904 epoch
+        mvhd = _read_mp4_mvhd(file_path)
+        if mvhd and mvhd[1] > 0:
+            return time.strftime("%Y-%m-%d", time.gmtime(mvhd[1]))
+        
         metadata = extract_metadata(file_path)
         creation_date = (
             metadata.get('format', {}).get('tags', {}).get('creation_time') or
@@ -598,15 +925,14 @@ def get_space_creation_date(file_path, specified_date=None):
         )
         
         if creation_date:
-            for fmt in ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%d", "%Y%m%d"]:
-                try:
-                    return datetime.strptime(creation_date, fmt).strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
+            try:
+                return _format_day(creation_date)
+            except ValueError:
+                pass
                     
         if specified_date:
             try:
-                return datetime.strptime(specified_date, "%Y-%m-%d").strftime("%Y-%m-%d")
+                return _format_day(specified_date)
             except ValueError:
                 logging.error(f"Invalid specified date format: {specified_date}")
                 
@@ -616,28 +942,51 @@ def get_space_creation_date(file_path, specified_date=None):
         logging.error(f"Error getting creation date: {e}")
         return datetime.now().strftime("%Y-%m-%d")
 
+def _tag_m4a_in_place(file_path, title=None, date=None):
+    """
+    Write title/date atoms with mutagen, which rewrites only moov/ilst, not the audio.
+    Returns False without touching the file if the tags already match.
+    """
+    audio = MP4(file_path)
+    if audio.tags is None:
+        audio.add_tags()
+    wanted = {}
+    if title:
+        wanted['\xa9nam'] = [title]
+    if date:
+        wanted['\xa9day'] = [date]
+    if all(audio.tags.get(key) == value for key, value in wanted.items()):
+        return False
+    audio.tags.update(wanted)
+    audio.save()
+    return True
+
 def add_metadata_to_m4a(file_path, title=None, date=None):
     """Add metadata to M4A file."""
+    if MP4 is not None:
+        try:
+            if _tag_m4a_in_place(file_path, title=title, date=date):
+                logging.info(f"Metadata added to {file_path}: title={title}, date={date}")
+            else:
+                logging.info(f"Metadata already up to date in {file_path}, skipping rewrite")
+            return
+        except Exception as e:
+            logging.warning(f"In-place tagging failed, falling back to ffmpeg: {e}")
+    
     try:
         temp_output = f"{os.path.splitext(file_path)[0]}_temp.m4a"
         command = [
             'ffmpeg',
+            '-y',  # Overwrite a leftover temp file from an interrupted run
+            '-v', 'error',
             '-i', file_path,
-            '-c', 'copy'
+            '-c', 'copy',
+            *_metadata_args(title, date),
+            temp_output
         ]
         
-        # Add metadata if provided
-        if title:
-            command.extend(['-metadata', f'title={title}'])
-        if date:
-            command.extend(['-metadata', f'date={date}'])
-            
-        command.append(temp_output)
-        
-        if os.path.exists(temp_output):
-            os.remove(temp_output)
-            
-        subprocess.run(command, check=True, capture_output=True, text=True)
+        # stderr is only kept for the error log, stdout is never used
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         
         # Only replace the original file if the temporary file was created successfully
         if os.path.exists(temp_output):
@@ -671,65 +1020,51 @@ def main():
         space_id = space_url.split('/')[-1]
         
         try:
-            # First, get metadata using yt-dlp
-            metadata_command = [
-                'yt-dlp',
-                '--cookies', user_input['cookie_path'],
-                '--dump-json',
-                '--no-download',
-                space_url
-            ]
+            # One in-process yt-dlp instance serves the metadata probe and the
+            # download, instead of starting the yt-dlp interpreter twice
+            temp_file_path = f'{TEMP_DIR}/X-Space-{space_id}_temp.m4a'
+            metadata_path = f'{TEMP_DIR}/X-Space-{space_id}_temp.info.json'
+            ydl = create_youtube_dl(user_input['cookie_path'], temp_file_path, args.debug)
             
-            try:
-                metadata_result = subprocess.run(metadata_command, capture_output=True, text=True, check=True)
-                space_info = json.loads(metadata_result.stdout)
-                space_title = str(space_info.get('title', ''))
-                space_date = space_info.get('upload_date', '')
-                expected_duration = float(space_info.get('duration', 0))
-                
-                # Save metadata JSON for future reference
-                metadata_path = f'{TEMP_DIR}/X-Space-{space_id}_metadata.json'
-                with open(metadata_path, 'w', encoding='utf-8') as f:
-                    json.dump(space_info, f, indent=2, ensure_ascii=False)
-                
-                # Analyze metrics first
-                analyze_space_metrics(metadata_path)
-                
-                # Then detect video space
-                formats = space_info.get('formats', [])
-                video_space = is_video_space(formats)
-                
-                if args.debug:
-                    logging.debug(f"Space metadata: title='{space_title}', date='{space_date}', "
-                                f"is_video={video_space}, duration={expected_duration/60:.1f}min")
-                    if formats:
-                        logging.debug("Available formats:")
-                        for fmt in formats:
-                            logging.debug(f"Format: {fmt}")
-                
-                if expected_duration > 0:
-                    logging.info(f"Expected space duration: {expected_duration/60:.1f} minutes")
-                
-            except Exception as e:
-                logging.warning(f"Failed to get space metadata: {e}")
-                space_title = None
-                space_date = None
-                video_space = False
-                expected_duration = 0
-                had_errors = True
+            space_info = None if args.refresh else load_cached_space_metadata(metadata_path)
+            from_cache = space_info is not None
+            if from_cache:
+                logging.info(f"Using cached space metadata from {metadata_path}")
+            else:
+                try:
+                    space_info = fetch_space_metadata(ydl, space_url)
+                except Exception as e:
+                    logging.warning(f"Failed to get space metadata: {e}")
+                    space_info = None
+                    had_errors = True
             
             specified_date = None
             if args.output:
-                date_match = re.search(r'(\d{4}-\d{2}-\d{2})', args.output)
+                date_match = _DATE_RE.search(args.output)
                 if date_match:
                     specified_date = date_match.group(1)
             
             space_folder = os.path.join(args.output, space_id)
-            os.makedirs(space_folder, exist_ok=True)
+            
+            space_title = None
+            space_date = None
+            video_space = False
+            expected_duration = 0
+            if space_info:
+                # Parsed before the download starts: yt-dlp writes into space_info
+                # (and its format dicts) while downloading
+                try:
+                    space_title, space_date, expected_duration, video_space = parse_space_info(space_info, args.debug)
+                except Exception as e:
+                    logging.warning(f"Failed to process space metadata: {e}")
+                    had_errors = True
             
             logging.info(f"Downloading X Space from: {space_url}")
             
-            temp_file_path, is_new_download = download_space(space_url, user_input['cookie_path'], args.debug)
+            # Create the destination first so a bad -o fails before a long download
+            os.makedirs(space_folder, exist_ok=True)
+            temp_file_path, is_new_download = download_space(ydl, space_url, space_info,
+                                                             refetch_on_error=from_cache)
             
             if temp_file_path:
                 if is_new_download:
@@ -744,7 +1079,7 @@ def main():
                     # Use space metadata if available, otherwise fall back to specified date
                     if space_date:
                         try:
-                            creation_date = datetime.strptime(space_date, "%Y%m%d").strftime("%Y-%m-%d")
+                            creation_date = _format_day(space_date)
                         except ValueError:
                             creation_date = get_space_creation_date(temp_file_path, specified_date)
                             had_errors = True
@@ -766,54 +1101,104 @@ def main():
                         output_title = f"{creation_date}-X-Space-#{space_id}"
                         had_errors = True
                     
+                    # A reused temp file may still be hard-linked to an earlier run's
+                    # output, which in-place tagging would otherwise rewrite too
+                    if not is_new_download:
+                        _unshare(temp_file_path)
+                    
                     # Add metadata to the M4A file
                     add_metadata_to_m4a(temp_file_path, title=title, date=creation_date)
                     
                     final_output_path = get_unique_output_path(space_folder, output_title, ".m4a")
                     
                     try:
-                        shutil.copy2(temp_file_path, final_output_path)
-                        logging.info(f"Successfully copied file to {final_output_path}")
-                        logging.info(f"Original audio file saved to: {os.path.abspath(final_output_path)}")
-                        
-                        file_size_mb = get_file_size_mb(final_output_path)
-                        logging.info(f"File size: {file_size_mb:.2f} MB")
-
-                        logging.info("Attempting to detect long silence...")
-                        long_silence_point = detect_long_silence(final_output_path, max_duration=7200000)  # 2 hours in milliseconds
-                        if long_silence_point:
-                            logging.info(f"Detected long silence at {long_silence_point/1000:.2f} seconds ({long_silence_point/60000:.2f} minutes). Trimming audio...")
-                            trimmed_output_path = get_unique_output_path(space_folder, f"{output_title}_trimmed", ".m4a")
-                            trim_audio(final_output_path, trimmed_output_path, long_silence_point)
+                        # The steps below only read the tagged temp file, so the metadata JSON
+                        # copies and the silence scan run alongside publishing the recording
+                        space_prefix = f'X-Space-{space_id}'
+                        dest_prefix = os.path.join(space_folder, '')  # joined once, not per entry
+                        metadata_copies = [
+                            (entry.path, f'{dest_prefix}{entry.name}')
+                            for entry in _scan_tmp(space_id)
+                            if entry.name.startswith(space_prefix)
+                            and any(x in entry.name for x in ['_metadata.json', '.info.json'])
+                        ]
+                        silence_processes = _ProcessGroup()
+                        executor = ThreadPoolExecutor(max_workers=3)
+                        metadata_future = silence_future = copy_future = None
+                        try:
+                            metadata_future = executor.submit(_copy_files, metadata_copies)
+                            logging.info("Attempting to detect long silence...")
+                            silence_future = executor.submit(detect_long_silence, temp_file_path, max_duration=7200000,  # 2 hours in milliseconds
+                                                             processes=silence_processes)
+                            
+                            _publish(temp_file_path, final_output_path)
+                            file_size_mb = get_file_size_mb(final_output_path)
+                            logging.info(f"Original audio file saved to: {os.path.abspath(final_output_path)} "
+                                         f"({file_size_mb:.2f} MB)")
                             
-                            # Check if the trimmed file is significantly smaller
-                            trimmed_size_mb = get_file_size_mb(trimmed_output_path)
-                            if trimmed_size_mb < file_size_mb * 0.9:  # If trimmed file is at least 10% smaller
-                                logging.info(f"Trimmed file is smaller ({trimmed_size_mb:.2f} MB). Keeping trimmed version.")
-                                os.remove(final_output_path)
-                                final_output_path = trimmed_output_path
+                            # Most recordings are not trimmed, so start the additional copy while the
+                            # silence scan runs; it is only redone if the trimmed version is kept
+                            original_output_path = final_output_path
+                            if args.output_copy:
+                                copy_future = executor.submit(copy_to_additional_location, final_output_path,
+                                                              args.output_copy, space_id)
+
+                            long_silence_point = silence_future.result()
+                            mvhd = _read_mp4_mvhd(final_output_path) if long_silence_point else None
+                            duration = mvhd[0] if mvhd and mvhd[0] > 0 else expected_duration
+                            if long_silence_point and duration and long_silence_point / 1000 >= duration * 0.9:
+                                # Cutting less than 10% of the audio is not worth writing a trimmed copy
+                                logging.info(f"Long silence at {long_silence_point/60000:.2f} minutes is too close to the end "
+                                             f"of the recording to be worth trimming. Keeping original file.")
+                            elif long_silence_point:
+                                logging.info(f"Detected long silence at {long_silence_point/1000:.2f} seconds ({long_silence_point/60000:.2f} minutes). Trimming audio...")
+                                trimmed_output_path = get_unique_output_path(space_folder, f"{output_title}_trimmed", ".m4a")
+                                trim_audio(final_output_path, trimmed_output_path, long_silence_point)
+                                
+                                # Check if the trimmed file is significantly smaller
+                                trimmed_size_mb = get_file_size_mb(trimmed_output_path)
+                                if trimmed_size_mb < file_size_mb * 0.9:  # If trimmed file is at least 10% smaller
+                                    logging.info(f"Trimmed file is smaller ({trimmed_size_mb:.2f} MB). Keeping trimmed version.")
+                                    if copy_future:
+                                        copy_future.result()  # still reading the original
+                                    os.remove(final_output_path)
+                                    final_output_path = trimmed_output_path
+                                else:
+                                    logging.info("Trimmed file is not significantly smaller. Keeping original file.")
+                                    os.remove(trimmed_output_path)
                             else:
-                                logging.info("Trimmed file is not significantly smaller. Keeping original file.")
-                                os.remove(trimmed_output_path)
-                        else:
-                            logging.info("No long silences detected after 2 hours. Keeping original file.")
-                        
-                        # Copy metadata files to destination
-                        metadata_files = glob.glob(os.path.join(TEMP_DIR, f'X-Space-{space_id}*.*'))
-                        for metadata_file in metadata_files:
-                            if any(x in metadata_file for x in ['_metadata.json', '.info.json']):
-                                dest_metadata = os.path.join(space_folder, os.path.basename(metadata_file))
-                                shutil.copy2(metadata_file, dest_metadata)
-                                logging.debug(f"Copied metadata file to: {dest_metadata}")
-                        
-                        # Handle additional output location if specified
-                        if args.output_copy:
-                            copy_to_additional_location(final_output_path, args.output_copy, space_id)
+                                logging.info("No long silences detected after 2 hours. Keeping original file.")
+                            
+                            # Handle additional output location if specified
+                            if copy_future:
+                                copy_future.result()
+                                if final_output_path != original_output_path:
+                                    # Replace the copy of the untrimmed original with the trimmed version
+                                    stale_copy = os.path.join(args.output_copy, space_id,
+                                                              os.path.basename(original_output_path))
+                                    try:
+                                        os.remove(stale_copy)
+                                    except FileNotFoundError:
+                                        pass
+                                    copy_to_additional_location(final_output_path, args.output_copy, space_id)
+                            
+                            metadata_future.result()
+                        except BaseException:
+                            # Report the failure now instead of waiting for a scan of hours of audio.
+                            # A running --output-copy transfer is left to finish: it copies the
+                            # recording that stays published locally.
+                            silence_processes.kill()
+                            for future in (metadata_future, silence_future, copy_future):
+                                if future:
+                                    future.cancel()  # only stops tasks that have not started
+                            executor.shutdown(wait=False)
+                            raise
+                        executor.shutdown()
                         
                         # Clean up duplicate files in destination
                         cleanup_destination_duplicates(space_folder, space_id)
                         
-                        success = True and not had_errors
+                        success = not had_errors
                         
                     except Exception as e:
                         logging.error(f"Error processing audio file: {str(e)}")
@@ -830,7 +1215,7 @@ def main():
                 had_errors = True
                 raise Exception("Failed to download or locate the space file.")
         
-        except subprocess.CalledProcessError as e:
+        except DownloadError as e:
             logging.error(f"Error occurred during download: {e}")
             had_errors = True
         except Exception as e:
@@ -853,10 +1238,12 @@ def main():
                 had_errors = True
 
             if success and not had_errors:
-                if is_new_download and os.path.exists(temp_file_path):
+                if is_new_download:
                     try:
                         os.remove(temp_file_path)
                         logging.info(f"Removed temporary file: {temp_file_path}")
+                    except FileNotFoundError:
+                        pass
                     except Exception as e:
                         logging.warning(f"Failed to remove temporary file: {e}")
                         had_errors = True